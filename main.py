@@ -6,7 +6,10 @@ from auac import migrate_auac
 from core import migrate_core
 from cronos import migrate_cronos
 from poa import migrate_poa
+from settings import settings
 from utils import (
+    CHECKPOINT_RUN_ID,
+    clear_extract_checkpoints,
     format_elapsed_time,
     setup_connections,
     setup_logging,
@@ -62,12 +65,15 @@ def main() -> None:
         elapsed_time = format_elapsed_time(start_time)
         logging.info(f"Total migration time: {elapsed_time}")
         logging.info("ETL process completed successfully")
+        clear_extract_checkpoints()
     except Exception as e:
         elapsed_time = format_elapsed_time(start_time)
         logging.error(
             f"Error during execution after {elapsed_time}: {e!s}",
             exc_info=True,
         )
+        if settings.EXTRACT_CHECKPOINT_DIR:
+            logging.info(f"Set EXTRACT_CHECKPOINT_RUN_ID={CHECKPOINT_RUN_ID} to retry with the extracted checkpoints")
         raise
 
 
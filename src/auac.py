@@ -1,10 +1,9 @@
 import logging
 import uuid
-from datetime import datetime, timezone
 
 import polars as pl
 
-from utils import ETLContext, extract_data, handle_timestamps, load_data, truncate_pg_table
+from utils import RUN_STARTED_AT, ETLContext, extract_data, handle_timestamps, load_data, truncate_pg_tables
 
 AUAC_TABLES = [
     "attachment_types",
@@ -33,10 +32,9 @@ def truncate_auac_tables(ctx: ETLContext) -> None:
     ctx : ETLContext
         The ETL context containing database connections
     """
-    logging.info(f'Truncating all target tables in PostgreSQL {ctx.pg_engine_auac}..."')
+    logging.info(f"Truncating all target tables in PostgreSQL {ctx.pg_engine_auac}...")
 
-    for table in AUAC_TABLES:
-        truncate_pg_table(ctx.pg_engine_core, table)
+    truncate_pg_tables(ctx.pg_engine_auac, AUAC_TABLES)
 
 
 def migrate_requirement_taxonomies(ctx: ETLContext) -> None:
@@ -81,7 +79,6 @@ def migrate_requirement_taxonomies(ctx: ETLContext) -> None:
     )
 
     # TODO: Questa cosa del fallback è giusta?
-    now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
     df_fallback = pl.DataFrame(
         [
             {
@@ -89,13 +86,15 @@ def migrate_requirement_taxonomies(ctx: ETLContext) -> None:
                 "name": "-",
                 "is_readonly": False,
                 "disabled_at": None,
-                "created_at": now,
-                "updated_at": now,
+                "created_at": RUN_STARTED_AT,
+                "updated_at": RUN_STARTED_AT,
             }
         ]
     )
 
-    df_result = pl.concat([df_tipo_requisito_tr, df_tipo_specifico_requisito_tr, df_fallback], how="vertical_relaxed")
+    df_result = pl.concat(
+        [df_tipo_requisito_tr, df_tipo_specifico_requisito_tr, df_fallback], how="vertical_relaxed", rechunk=False
+    )
 
     ### LOAD ###
     load_data(ctx.pg_engine_auac, df_result, "requirement_taxonomies")
@@ -1,6 +1,5 @@
 import concurrent.futures
 import io
-import json
 import logging
 import time
 import uuid
@@ -10,15 +9,19 @@ from tqdm import tqdm
 
 from utils import (
     ETLContext,
+    copy_data,
     extract_data,
     extract_data_from_csv,
+    extract_data_parallel,
     handle_datetime,
     handle_enum_mapping,
+    handle_flag,
     handle_text,
     handle_timestamps,
     handle_year,
     load_data,
-    truncate_pg_table,
+    run_migrations,
+    truncate_pg_tables,
 )
 
 CORE_TABLES = [
@@ -64,8 +67,7 @@ def truncate_core_tables(ctx: ETLContext) -> None:
     """
     logging.info(f"Truncating all target tables in PostgreSQL {ctx.pg_engine_core}...")
 
-    for table in CORE_TABLES:
-        truncate_pg_table(ctx.pg_engine_core, table)
+    truncate_pg_tables(ctx.pg_engine_core, CORE_TABLES)
 
 
 ### LOCATION ###
@@ -393,19 +395,15 @@ def migrate_physical_structures(ctx: ETLContext) -> None:
         timestamp_exprs["created_at"],
         timestamp_exprs["updated_at"],
         timestamp_exprs["disabled_at"],
-        pl.struct(
-            [
+        pl.when(pl.col("ID_FASCICOLO_DOCWAY").is_null() & pl.col("ID_COMPRENSORIO_FK").is_null())
+        .then(pl.lit("{}"))
+        .otherwise(
+            pl.struct(
                 pl.col("ID_FASCICOLO_DOCWAY").alias("docway_file_id"),
                 pl.col("ID_COMPRENSORIO_FK").alias("area_id"),
-            ]
-        ).alias("extra"),
-    )
-
-    df_result = df_result.with_columns(
-        pl.col("extra").map_elements(
-            lambda x: ("{}" if x["docway_file_id"] is None and x["area_id"] is None else json.dumps(x)),
-            return_dtype=pl.String,
+            ).struct.json_encode()
         )
+        .alias("extra"),
     )
 
     ### LOAD ###
@@ -504,19 +502,10 @@ def migrate_buildings(ctx: ETLContext) -> None:
         timestamp_exprs["created_at"],
         timestamp_exprs["updated_at"],
         timestamp_exprs["disabled_at"],
-        pl.struct(
-            [
-                pl.col("ID_FASCICOLO_DOCWAY").alias("docway_file_id"),
-            ]
-        ).alias("extra"),
-    )
-
-    # Convert extra column to JSON
-    df_result = df_result.with_columns(
-        pl.col("extra").map_elements(
-            lambda x: "{}" if x["docway_file_id"] is None else json.dumps(x),
-            return_dtype=pl.String,
-        )
+        pl.when(pl.col("ID_FASCICOLO_DOCWAY").is_null())
+        .then(pl.lit("{}"))
+        .otherwise(pl.struct(pl.col("ID_FASCICOLO_DOCWAY").alias("docway_file_id")).struct.json_encode())
+        .alias("extra"),
     )
 
     ### LOAD ###
@@ -682,6 +671,7 @@ def migrate_specialties(ctx: ETLContext) -> None:
     df_result = pl.concat(
         [df_branca_templ_not_altro_tr, df_artic_branca_altro_templ_tr, df_disciplines],
         how="diagonal_relaxed",
+        rechunk=False,
     )
 
     ### LOAD ###
@@ -1096,7 +1086,11 @@ def migrate_production_factor_types(ctx: ETLContext) -> None:
         The ETL context containing database connections
     """
     ### EXTRACT ###
-    df_tipo_fattore_prod_templ = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.TIPO_FATTORE_PROD_TEMPL")
+    df_tipo_fattore_prod_templ = extract_data(
+        ctx.oracle_engine_area,
+        "SELECT CLIENTID, NOME, DESCR, TIPOLOGIA_FATT_PROD, DISABLED, CREATION, LAST_MOD "
+        "FROM AUAC_USR.TIPO_FATTORE_PROD_TEMPL",
+    ).lazy()
 
     ### TRANSFORM ###
     timestamp_exprs = handle_timestamps()
@@ -1128,33 +1122,32 @@ def migrate_production_factors(ctx: ETLContext) -> None:
         The ETL context containing database connections
     """
     ### EXTRACT ###
-    df_fatt_prod_udo_model = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.FATT_PROD_UDO_MODEL")
+    df_fatt_prod_udo_model = extract_data(
+        ctx.oracle_engine_area,
+        "SELECT CLIENTID, ID_TIPO_FK, VALORE, VALORE2, VALORE3, DESCR, DISABLED, CREATION, LAST_MOD "
+        "FROM AUAC_USR.FATT_PROD_UDO_MODEL",
+    ).lazy()
 
     ### TRANSFORM ###
     timestamp_exprs = handle_timestamps()
 
+    # "NUL" is a single sentinel: mask it with a plain equality instead of a lookup-table replace
+    room_name = pl.col("VALORE2").str.strip_chars().str.replace_all(r"\s+", " ")
+    room_code = pl.col("DESCR").str.strip_chars().str.replace_all(r"\s+", " ")
+
+    def bed_count(col: str) -> pl.Expr:
+        # Missing, empty and "?" counts are masked to null and zero-filled as integers, any other malformed or out
+        # of range count still fails the strict cast
+        count = pl.col(col).str.strip_chars()
+        return pl.when(count.is_in(["", "?"]).not_()).then(count).cast(pl.UInt16).fill_null(0)
+
     df_result = df_fatt_prod_udo_model.select(
         pl.col("CLIENTID").str.strip_chars().alias("id"),
         pl.col("ID_TIPO_FK").str.strip_chars().alias("production_factor_type_id"),
-        pl.col("VALORE").str.strip_chars().replace(["", "?"], "0").fill_null("0").cast(pl.UInt16).alias("num_beds"),
-        pl.col("VALORE3")
-        .str.strip_chars()
-        .replace(["", "?"], "0")
-        .fill_null("0")
-        .cast(pl.UInt16)
-        .alias("num_hospital_beds"),
-        pl.col("VALORE2")
-        .str.strip_chars()
-        .str.replace_all(r"\s+", " ")
-        .replace(["NUL"], None)
-        .str.replace_all("\x00", "")
-        .alias("room_name"),
-        pl.col("DESCR")
-        .str.strip_chars()
-        .str.replace_all(r"\s+", " ")
-        .replace(["NUL"], None)
-        .str.replace_all("\x00", "")
-        .alias("room_code"),
+        bed_count("VALORE").alias("num_beds"),
+        bed_count("VALORE3").alias("num_hospital_beds"),
+        pl.when(room_name.ne("NUL")).then(room_name).str.replace_all("\x00", "").alias("room_name"),
+        pl.when(room_code.ne("NUL")).then(room_code).str.replace_all("\x00", "").alias("room_code"),
         timestamp_exprs["disabled_at"],
         timestamp_exprs["created_at"],
         timestamp_exprs["updated_at"],
@@ -1178,7 +1171,8 @@ def migrate_udo_type_classifications(ctx: ETLContext) -> None:
     """
     ### EXTRACT ###
     df_classificazione_udo_templ = extract_data(
-        ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.CLASSIFICAZIONE_UDO_TEMPL"
+        ctx.oracle_engine_area,
+        "SELECT CLIENTID, NOME, DISABLED, CREATION, LAST_MOD FROM AUAC_USR.CLASSIFICAZIONE_UDO_TEMPL",
     )
 
     ### TRANSFORM ###
@@ -1196,6 +1190,13 @@ def migrate_udo_type_classifications(ctx: ETLContext) -> None:
     load_data(ctx.pg_engine_core, df_result, "udo_type_classifications")
 
 
+UDO_TYPE_NATURE_MAPPING = {
+    "AzSan": "AZIENDA_SANITARIA",
+    "Pub": "PUBBLICO",
+    "Pri": "PRIVATO",
+}
+
+
 def migrate_udo_types(ctx: ETLContext) -> None:
     """
     Migrate UDO types from Oracle to PostgreSQL.
@@ -1209,13 +1210,30 @@ def migrate_udo_types(ctx: ETLContext) -> None:
         The ETL context containing database connections
     """
     ### EXTRACT ###
-    df_tipo_udo_22_templ = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.TIPO_UDO_22_TEMPL")
-    df_bind_tipo_22_ambito = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.BIND_TIPO_22_AMBITO")
-    df_ambito_templ = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.AMBITO_TEMPL")
-    df_bind_tipo_22_natura = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.BIND_TIPO_22_NATURA")
-    df_natura_titolare_templ = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.NATURA_TITOLARE_TEMPL")
-    df_bind_tipo_22_flusso = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.BIND_TIPO_22_FLUSSO")
-    df_flusso_templ = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.FLUSSO_TEMPL")
+    # Keep the whole transform lazy so Polars can push projections and filters through the joins
+    dfs = extract_data_parallel(
+        ctx.oracle_engine_area,
+        {
+            "TIPO_UDO_22_TEMPL": "SELECT CLIENTID, DESCR, CODICE_UDO, NOME_CODICE_UDO, SETTING, TARGET, "
+            "ID_CLASSIFICAZIONE_UDO_FK, OSPEDALIERO, SALUTE_MENTALE, POSTI_LETTO, DISABLED, CREATION, LAST_MOD "
+            "FROM AUAC_USR.TIPO_UDO_22_TEMPL",
+            "BIND_TIPO_22_AMBITO": "SELECT ID_AMBITO_FK, ID_TIPO_22_FK FROM AUAC_USR.BIND_TIPO_22_AMBITO",
+            "AMBITO_TEMPL": "SELECT CLIENTID, NOME, DESCR, AGGIUNGI_DISCIPLINE, AGGIUNGI_BRANCHE, "
+            "AGGIUNGI_PRESTAZIONI, AGGIUNGI_AMBITO, AGGIUNGI_DISCIPLINE_AZ_SAN, AGGIUNGI_DISCIPLINE_PUB_PRIV, "
+            "AGGIUNGI_BRANCHE_AZ_SAN, AGGIUNGI_BRANCHE_PUB_PRIV FROM AUAC_USR.AMBITO_TEMPL",
+            "BIND_TIPO_22_NATURA": "SELECT ID_NATURA_FK, ID_TIPO_UDO_22_FK FROM AUAC_USR.BIND_TIPO_22_NATURA",
+            "NATURA_TITOLARE_TEMPL": "SELECT CLIENTID, NOME FROM AUAC_USR.NATURA_TITOLARE_TEMPL",
+            "BIND_TIPO_22_FLUSSO": "SELECT ID_FLUSSO_FK, ID_TIPO_UDO_22_FK FROM AUAC_USR.BIND_TIPO_22_FLUSSO",
+            "FLUSSO_TEMPL": "SELECT CLIENTID, NOME FROM AUAC_USR.FLUSSO_TEMPL",
+        },
+    )
+    df_tipo_udo_22_templ = dfs["TIPO_UDO_22_TEMPL"].lazy()
+    df_bind_tipo_22_ambito = dfs["BIND_TIPO_22_AMBITO"].lazy()
+    df_ambito_templ = dfs["AMBITO_TEMPL"].lazy()
+    df_bind_tipo_22_natura = dfs["BIND_TIPO_22_NATURA"].lazy()
+    df_natura_titolare_templ = dfs["NATURA_TITOLARE_TEMPL"].lazy()
+    df_bind_tipo_22_flusso = dfs["BIND_TIPO_22_FLUSSO"].lazy()
+    df_flusso_templ = dfs["FLUSSO_TEMPL"].lazy()
 
     ### TRANSFORM ###
     df_tipo_udo_22_templ = df_tipo_udo_22_templ.select(
@@ -1226,18 +1244,9 @@ def migrate_udo_types(ctx: ETLContext) -> None:
         pl.col("SETTING").str.strip_chars(),
         pl.col("TARGET").str.strip_chars(),
         pl.col("ID_CLASSIFICAZIONE_UDO_FK"),
-        pl.when(pl.col("OSPEDALIERO").str.strip_chars().str.to_lowercase().is_in(["s", "y"]))
-        .then(True)
-        .otherwise(False)
-        .alias("OSPEDALIERO"),
-        pl.when(pl.col("SALUTE_MENTALE").str.strip_chars().str.to_lowercase().is_in(["s", "y"]))
-        .then(True)
-        .otherwise(False)
-        .alias("SALUTE_MENTALE"),
-        pl.when(pl.col("POSTI_LETTO").str.strip_chars().str.to_lowercase().is_in(["s", "y"]))
-        .then(True)
-        .otherwise(False)
-        .alias("POSTI_LETTO"),
+        handle_flag("OSPEDALIERO", "OSPEDALIERO"),
+        handle_flag("SALUTE_MENTALE", "SALUTE_MENTALE"),
+        handle_flag("POSTI_LETTO", "POSTI_LETTO"),
         pl.col("DISABLED"),
         pl.col("CREATION"),
         pl.col("LAST_MOD"),
@@ -1253,38 +1262,14 @@ def migrate_udo_types(ctx: ETLContext) -> None:
         pl.col("CLIENTID").str.strip_chars().alias("CLIENTID_AMBITO_TEMPL"),
         pl.col("NOME").str.strip_chars().alias("AMBITO_NOME"),
         pl.col("DESCR").str.strip_chars().alias("AMBITO_DESCR"),
-        pl.when(pl.col("AGGIUNGI_DISCIPLINE").str.strip_chars().str.to_lowercase().is_in(["s", "y"]))
-        .then(True)
-        .otherwise(False)
-        .alias("AGGIUNGI_DISCIPLINE"),
-        pl.when(pl.col("AGGIUNGI_BRANCHE").str.strip_chars().str.to_lowercase().is_in(["s", "y"]))
-        .then(True)
-        .otherwise(False)
-        .alias("AGGIUNGI_BRANCHE"),
-        pl.when(pl.col("AGGIUNGI_PRESTAZIONI").str.strip_chars().str.to_lowercase().is_in(["s", "y"]))
-        .then(True)
-        .otherwise(False)
-        .alias("AGGIUNGI_PRESTAZIONI"),
-        pl.when(pl.col("AGGIUNGI_AMBITO").str.strip_chars().str.to_lowercase().is_in(["s", "y"]))
-        .then(True)
-        .otherwise(False)
-        .alias("AGGIUNGI_AMBITO"),
-        pl.when(pl.col("AGGIUNGI_DISCIPLINE_AZ_SAN").str.strip_chars().str.to_lowercase().is_in(["s", "y"]))
-        .then(True)
-        .otherwise(False)
-        .alias("AGGIUNGI_DISCIPLINE_AZ_SAN"),
-        pl.when(pl.col("AGGIUNGI_DISCIPLINE_PUB_PRIV").str.strip_chars().str.to_lowercase().is_in(["s", "y"]))
-        .then(True)
-        .otherwise(False)
-        .alias("AGGIUNGI_DISCIPLINE_PUB_PRIV"),
-        pl.when(pl.col("AGGIUNGI_BRANCHE_AZ_SAN").str.strip_chars().str.to_lowercase().is_in(["s", "y"]))
-        .then(True)
-        .otherwise(False)
-        .alias("AGGIUNGI_BRANCHE_AZ_SAN"),
-        pl.when(pl.col("AGGIUNGI_BRANCHE_PUB_PRIV").str.strip_chars().str.to_lowercase().is_in(["s", "y"]))
-        .then(True)
-        .otherwise(False)
-        .alias("AGGIUNGI_BRANCHE_PUB_PRIV"),
+        handle_flag("AGGIUNGI_DISCIPLINE", "AGGIUNGI_DISCIPLINE"),
+        handle_flag("AGGIUNGI_BRANCHE", "AGGIUNGI_BRANCHE"),
+        handle_flag("AGGIUNGI_PRESTAZIONI", "AGGIUNGI_PRESTAZIONI"),
+        handle_flag("AGGIUNGI_AMBITO", "AGGIUNGI_AMBITO"),
+        handle_flag("AGGIUNGI_DISCIPLINE_AZ_SAN", "AGGIUNGI_DISCIPLINE_AZ_SAN"),
+        handle_flag("AGGIUNGI_DISCIPLINE_PUB_PRIV", "AGGIUNGI_DISCIPLINE_PUB_PRIV"),
+        handle_flag("AGGIUNGI_BRANCHE_AZ_SAN", "AGGIUNGI_BRANCHE_AZ_SAN"),
+        handle_flag("AGGIUNGI_BRANCHE_PUB_PRIV", "AGGIUNGI_BRANCHE_PUB_PRIV"),
     )
 
     df_bind_tipo_22_natura = df_bind_tipo_22_natura.select(
@@ -1321,55 +1306,39 @@ def migrate_udo_types(ctx: ETLContext) -> None:
         how="left",
     )
 
+    # Filter out records with empty scope_name before the natures and flows are attached
+    df_result = df_result.filter(pl.col("AMBITO_NOME").is_not_null() & (pl.col("AMBITO_NOME") != ""))
+
     # Process company natures (nature)
-    # First, get all natures for each UDO type
+    # First, get all natures for each UDO type; bindings to a missing nature would only be dropped by the aggregation
     df_natures = df_bind_tipo_22_natura.join(
         df_natura_titolare_templ,
         left_on="ID_NATURA_FK",
         right_on="CLIENTID",
-        how="left",
+        how="inner",
     )
 
-    # Group by UDO type and collect natures into a list
-    df_natures_grouped = df_natures.group_by("ID_TIPO_UDO_22_FK").agg(pl.col("NOME").alias("NATURE"))
-
-    # Map nature names to standardized values and ensure we're using Python lists, not NumPy arrays
-    df_natures_grouped = df_natures_grouped.with_columns(
-        pl.col("NATURE").map_elements(
-            lambda x: [
-                "AZIENDA_SANITARIA"
-                if item == "AzSan"
-                else "PUBBLICO"
-                if item == "Pub"
-                else "PRIVATO"
-                if item == "Pri"
-                else item
-                for item in (list(x) if x is not None else [])
-            ],
-            return_dtype=pl.List,
-        )
+    # Map nature names to standardized values, then group by UDO type and collect natures into a list
+    df_natures_grouped = (
+        df_natures.with_columns(pl.col("NOME").replace(UDO_TYPE_NATURE_MAPPING))
+        .group_by("ID_TIPO_UDO_22_FK")
+        .agg(pl.col("NOME").drop_nulls().alias("NATURE"))
     )
 
     # Process ministerial flows (flussi)
-    # First, get all flows for each UDO type
+    # First, get all flows for each UDO type; bindings to a missing flow would only be dropped by the aggregation
     df_flows = df_bind_tipo_22_flusso.join(
         df_flusso_templ,
         left_on="ID_FLUSSO_FK",
         right_on="CLIENTID",
-        how="left",
+        how="inner",
     )
 
-    # Group by UDO type and collect flows into a list
-    df_flows_grouped = df_flows.group_by("ID_TIPO_UDO_22_FK").agg(pl.col("NOME").alias("FLUSSI"))
-
-    # Clean and standardize flow names and ensure we're using Python lists, not NumPy arrays
-    df_flows_grouped = df_flows_grouped.with_columns(
-        pl.col("FLUSSI").map_elements(
-            lambda x: [item.replace(" ", "_").replace(".", "_") for item in list(x) if item is not None]
-            if x is not None
-            else [],
-            return_dtype=pl.List,
-        )
+    # Clean and standardize flow names, then group by UDO type and collect flows into a list
+    df_flows_grouped = (
+        df_flows.with_columns(pl.col("NOME").str.replace_all(r"[ .]", "_"))
+        .group_by("ID_TIPO_UDO_22_FK")
+        .agg(pl.col("NOME").drop_nulls().alias("FLUSSI"))
     )
 
     # Join natures and flows to the result
@@ -1393,9 +1362,6 @@ def migrate_udo_types(ctx: ETLContext) -> None:
         pl.col("FLUSSI").fill_null([]),
     )
 
-    # Filter out records with empty scope_name
-    df_result = df_result.filter(pl.col("AMBITO_NOME").is_not_null() & (pl.col("AMBITO_NOME") != ""))
-
     timestamp_exprs = handle_timestamps()
 
     # Rename columns to match the target schema
@@ -1428,28 +1394,6 @@ def migrate_udo_types(ctx: ETLContext) -> None:
     )
 
     ### LOAD ###
-    # Convert array columns to PostgreSQL array format to ensure compatibility
-    df_result = df_result.with_columns(
-        [
-            pl.col("company_natures")
-            .map_elements(
-                lambda x: "{" + ",".join(f'"{item!s}"' for item in x if item is not None) + "}"
-                if x is not None
-                else "{}",
-                return_dtype=pl.Utf8,
-            )
-            .alias("company_natures"),
-            pl.col("ministerial_flows")
-            .map_elements(
-                lambda x: "{" + ",".join(f'"{item!s}"' for item in x if item is not None) + "}"
-                if x is not None
-                else "{}",
-                return_dtype=pl.Utf8,
-            )
-            .alias("ministerial_flows"),
-        ]
-    )
-
     load_data(ctx.pg_engine_core, df_result, "udo_types")
 
 
@@ -1461,19 +1405,31 @@ def migrate_udos(ctx: ETLContext) -> None:
         ctx: The ETL context containing database connections
     """
     ### EXTRACT ###
-    df_udo_model = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.UDO_MODEL")
-    df_sede_oper_model = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.SEDE_OPER_MODEL")
-    df_struttura_model = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.STRUTTURA_MODEL")
-    df_uo_model = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.UO_MODEL")
+    dfs = extract_data_parallel(
+        ctx.oracle_engine_area,
+        {
+            "UDO_MODEL": "SELECT CLIENTID, DESCR, STATO, ID_UNIVOCO, ID_TIPO_UDO_22_FK, ID_SEDE_FK, "
+            "ID_EDIFICIO_STR_FK, PIANO, BLOCCO, PROGRESSIVO, CODICE_FLUSSO_MINISTERIALE, COD_FAR_FAD, SIO, "
+            "STAREP, CDC, PAROLE_CHIAVE, ANNOTATIONS, WEEK, AUAC, FLAG_MODULO, PROVENIENZA_UO, ID_UO, "
+            "DISABLED, CREATION, LAST_MOD FROM AUAC_USR.UDO_MODEL",
+            # Resolve each operational office's company on the Oracle side
+            "SEDE_OPER_MODEL": "SELECT s.CLIENTID, st.ID_TITOLARE_FK FROM AUAC_USR.SEDE_OPER_MODEL s "
+            "LEFT JOIN AUAC_USR.STRUTTURA_MODEL st ON TRIM(st.CLIENTID) = TRIM(s.ID_STRUTTURA_FK)",
+            "UO_MODEL": "SELECT CLIENTID, ID_UO FROM AUAC_USR.UO_MODEL",
+        },
+    )
+    df_udo_model = dfs["UDO_MODEL"].lazy()
+    df_sede_oper_model = dfs["SEDE_OPER_MODEL"].lazy()
+    df_uo_model = dfs["UO_MODEL"].lazy()
 
     ### TRANSFORM ###
     timestamp_exprs = handle_timestamps()
 
     df_result = df_udo_model.select(
         pl.col("CLIENTID").str.strip_chars().alias("id"),
-        pl.col("DESCR").str.strip_chars().str.replace_all("\n", "").str.replace_all("\r", "").alias("name"),
+        pl.col("DESCR").str.strip_chars().str.replace_all(r"[\r\n]", "").alias("name"),
         pl.col("STATO").str.strip_chars().str.to_uppercase().fill_null("NUOVA").alias("status"),
-        pl.col("ID_UNIVOCO").str.strip_chars().str.replace_all("\n", "").str.replace_all("\r", "").alias("code"),
+        pl.col("ID_UNIVOCO").str.strip_chars().str.replace_all(r"[\r\n]", "").alias("code"),
         pl.col("ID_TIPO_UDO_22_FK").str.strip_chars().alias("udo_type_id"),
         pl.col("ID_SEDE_FK").str.strip_chars().alias("operational_office_id"),
         pl.col("ID_EDIFICIO_STR_FK").str.strip_chars().alias("building_id"),
@@ -1482,20 +1438,14 @@ def migrate_udos(ctx: ETLContext) -> None:
         pl.col("PROGRESSIVO").str.strip_chars().replace("-", None).alias("progressive"),
         pl.col("CODICE_FLUSSO_MINISTERIALE").str.strip_chars().alias("ministerial_code"),
         pl.col("COD_FAR_FAD").str.strip_chars().alias("farfad_code"),
-        pl.when(pl.col("SIO").str.strip_chars().str.to_lowercase() == "y").then(True).otherwise(False).alias("is_sio"),
+        handle_flag("SIO", "is_sio", true_values=("y",)),
         pl.col("STAREP").str.strip_chars().alias("starep_code"),
         pl.col("CDC").str.strip_chars().alias("cost_center"),
         pl.col("PAROLE_CHIAVE").str.strip_chars().alias("keywords"),
-        pl.col("ANNOTATIONS").str.strip_chars().str.replace_all("\n", "").str.replace_all("\r", "").alias("notes"),
-        pl.when(pl.col("WEEK").str.strip_chars().str.to_lowercase() == "y")
-        .then(True)
-        .otherwise(False)
-        .alias("is_open_only_on_business_days"),
+        pl.col("ANNOTATIONS").str.strip_chars().str.replace_all(r"[\r\n]", "").alias("notes"),
+        handle_flag("WEEK", "is_open_only_on_business_days", true_values=("y",)),
         pl.when(pl.col("AUAC") == 1).then(True).otherwise(False).alias("is_auac"),
-        pl.when(pl.col("FLAG_MODULO").str.strip_chars().str.to_lowercase() == "y")
-        .then(True)
-        .otherwise(False)
-        .alias("is_module"),
+        handle_flag("FLAG_MODULO", "is_module", true_values=("y",)),
         pl.lit(None).alias("organigram_node_id"),  # TODO: Link with poa-service
         pl.when(pl.col("PROVENIENZA_UO") == "ORGANIGRAMMA_TREE").then(None).otherwise(pl.col("ID_UO")).alias("ID_UO"),
         timestamp_exprs["disabled_at"],
@@ -1503,22 +1453,13 @@ def migrate_udos(ctx: ETLContext) -> None:
         timestamp_exprs["updated_at"],
     )
 
-    df_1 = df_sede_oper_model.select(
+    df_x = df_sede_oper_model.select(
         pl.col("CLIENTID").str.strip_chars().alias("operational_office_id"),
-        pl.col("ID_STRUTTURA_FK").str.strip_chars().alias("physical_structure_id"),
-    )
-
-    df_2 = df_struttura_model.select(
-        pl.col("CLIENTID").str.strip_chars().alias("physical_structure_id"),
         pl.col("ID_TITOLARE_FK").str.strip_chars().alias("company_id"),
     )
 
-    df_x = df_1.join(df_2, on="physical_structure_id", how="left").select(
-        pl.col("operational_office_id"),
-        pl.col("company_id"),
-    )
-
-    df_result = df_result.join(df_x, on="operational_office_id", how="left")
+    # CLIENTID is the primary key of SEDE_OPER_MODEL, so this join is many-to-one
+    df_result = df_result.join(df_x, on="operational_office_id", how="left", validate="m:1")
 
     df_z = df_uo_model.select(
         pl.col("CLIENTID").str.strip_chars().alias("operational_unit_id"),
@@ -1540,18 +1481,16 @@ def migrate_udo_production_factors(ctx: ETLContext) -> None:
     Args:
         ctx: The ETL context containing database connections
     """
-    ### EXTRACT ###
-    df_bind_udo_fatt_prod = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.BIND_UDO_FATT_PROD")
-
-    ### TRANSFORM ###
-    df_result = df_bind_udo_fatt_prod.select(
-        pl.col("ID_FATTORE_FK").str.strip_chars().alias("production_factor_id"),
-        pl.col("ID_UDO_FK").str.strip_chars().alias("udo_id"),
+    # Pure link table: trimmed in the source query and copied straight to PostgreSQL
+    copy_data(
+        ctx.oracle_engine_area,
+        "SELECT TRIM(ID_FATTORE_FK), TRIM(ID_UDO_FK) FROM AUAC_USR.BIND_UDO_FATT_PROD "
+        "WHERE ID_FATTORE_FK IS NOT NULL AND ID_UDO_FK IS NOT NULL",
+        ctx.pg_engine_core,
+        "udo_production_factors",
+        ["production_factor_id", "udo_id"],
     )
 
-    ### LOAD ###
-    load_data(ctx.pg_engine_core, df_result, "udo_production_factors")
-
 
 def migrate_udo_type_production_factor_types(ctx: ETLContext) -> None:
     """
@@ -1560,18 +1499,16 @@ def migrate_udo_type_production_factor_types(ctx: ETLContext) -> None:
     Args:
         ctx: The ETL context containing database connections
     """
-    ### EXTRACT ###
-    df_bind_tipo_22_tipo_fatt = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.BIND_TIPO_22_TIPO_FATT")
-
-    ### TRANSFORM ###
-    df_result = df_bind_tipo_22_tipo_fatt.select(
-        pl.col("ID_TIPO_UDO_22_FK").str.strip_chars().alias("udo_type_id"),
-        pl.col("ID_TIPO_FATT_FK").str.strip_chars().alias("production_factor_type_id"),
+    # Pure link table: trimmed in the source query and copied straight to PostgreSQL
+    copy_data(
+        ctx.oracle_engine_area,
+        "SELECT TRIM(ID_TIPO_UDO_22_FK), TRIM(ID_TIPO_FATT_FK) FROM AUAC_USR.BIND_TIPO_22_TIPO_FATT "
+        "WHERE ID_TIPO_UDO_22_FK IS NOT NULL AND ID_TIPO_FATT_FK IS NOT NULL",
+        ctx.pg_engine_core,
+        "udo_type_production_factor_types",
+        ["udo_type_id", "production_factor_type_id"],
     )
 
-    ### LOAD ###
-    load_data(ctx.pg_engine_core, df_result, "udo_type_production_factor_types")
-
 
 def migrate_udo_specialties(ctx: ETLContext) -> None:
     """
@@ -1581,21 +1518,27 @@ def migrate_udo_specialties(ctx: ETLContext) -> None:
         ctx: The ETL context containing database connections
     """
     ### EXTRACT ###
-    df_bind_udo_branca = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.BIND_UDO_BRANCA")
-    df_bind_udo_branca_altro = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.BIND_UDO_BRANCA_ALTRO")
-    df_bind_udo_disciplina = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.BIND_UDO_DISCIPLINA")
-    df_uo_model = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.UO_MODEL")
+    df_bind_udo_branca = extract_data(
+        ctx.oracle_engine_area,
+        "SELECT ID_BRANCA_FK, ID_UDO_FK, AUTORIZZATA, ACCREDITATA FROM AUAC_USR.BIND_UDO_BRANCA "
+        "WHERE ID_BRANCA_FK IS NOT NULL AND ID_UDO_FK IS NOT NULL",
+    )
+    df_bind_udo_branca_altro = extract_data(
+        ctx.oracle_engine_area,
+        "SELECT ID_ARTIC_BRANCA_ALTRO_FK, ID_UDO_FK FROM AUAC_USR.BIND_UDO_BRANCA_ALTRO "
+        "WHERE ID_ARTIC_BRANCA_ALTRO_FK IS NOT NULL AND ID_UDO_FK IS NOT NULL",
+    )
+    df_bind_udo_disciplina = extract_data(
+        ctx.oracle_engine_area,
+        "SELECT d.ID_DISCIPLINA_FK, d.ID_UDO_FK, d.POSTI_LETTO, d.POSTI_LETTO_EXTRA, d.POSTI_LETTO_OBI, "
+        "d.POSTI_LETTO_ACC, d.HSP12, u.CLIENTID FROM AUAC_USR.BIND_UDO_DISCIPLINA d "
+        "LEFT JOIN AUAC_USR.UO_MODEL u ON u.ID_UO = d.ID_UO",
+    )
 
     ### TRANSFORM ###
     df_bind_udo_branca_tr = df_bind_udo_branca.select(
-        pl.when(pl.col("AUTORIZZATA").str.strip_chars().str.to_lowercase().is_in(["s", "y"]))
-        .then(True)
-        .otherwise(False)
-        .alias("is_authorized"),
-        pl.when(pl.col("ACCREDITATA").str.strip_chars().str.to_lowercase().is_in(["s", "y"]))
-        .then(True)
-        .otherwise(False)
-        .alias("is_accredited"),
+        handle_flag("AUTORIZZATA", "is_authorized"),
+        handle_flag("ACCREDITATA", "is_accredited"),
         pl.lit(None).alias("num_beds"),
         pl.lit(None).alias("num_extra_beds"),
         pl.lit(None).alias("num_mortuary_beds"),
@@ -1619,7 +1562,9 @@ def migrate_udo_specialties(ctx: ETLContext) -> None:
         pl.col("ID_ARTIC_BRANCA_ALTRO_FK").str.strip_chars().alias("specialty_id"),
         pl.col("ID_UDO_FK").str.strip_chars().alias("udo_id"),
     )
-    df_result_branches = pl.concat([df_bind_udo_branca_tr, df_bind_udo_branca_altro_tr], how="vertical_relaxed")
+    df_result_branches = pl.concat(
+        [df_bind_udo_branca_tr, df_bind_udo_branca_altro_tr], how="vertical_relaxed", rechunk=False
+    )
 
     df_bind_udo_disciplina_tr = df_bind_udo_disciplina.filter(
         pl.col(
@@ -1636,21 +1581,11 @@ def migrate_udo_specialties(ctx: ETLContext) -> None:
         pl.lit(None).alias("clinical_poa_node_id"),
         pl.col("ID_DISCIPLINA_FK").str.strip_chars().alias("specialty_id"),
         pl.col("ID_UDO_FK").str.strip_chars().alias("udo_id"),
-        pl.col("ID_UO").alias("ID_UO"),
-        pl.col("PROVENIENZA_UO").alias("PROVENIENZA_UO"),
-    )
-    df_uo_model_tr = df_uo_model.select(
         pl.col("CLIENTID").str.strip_chars().alias("clinical_operational_unit_id"),
-        pl.col("ID_UO").alias("ID_UO"),
     )
-    df_result_disciplines = df_bind_udo_disciplina_tr.join(
-        df_uo_model_tr,
-        on="ID_UO",
-        how="left",
-    )
-    df_result_disciplines = df_result_disciplines.drop(["ID_UO", "PROVENIENZA_UO"])
 
-    df_result = pl.concat([df_result_branches, df_result_disciplines], how="diagonal_relaxed")
+    # The result is only written out as CSV, which does not need contiguous columns
+    df_result = pl.concat([df_result_branches, df_bind_udo_disciplina_tr], how="diagonal_relaxed", rechunk=False)
 
     ### LOAD ###
     load_data(ctx.pg_engine_core, df_result, "udo_specialties")
@@ -1663,18 +1598,15 @@ def migrate_udo_resolutions(ctx: ETLContext) -> None:
     Args:
         ctx: The ETL context containing database connections
     """
-    ### EXTRACT ###
-    df_bind_atto_udo = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.BIND_ATTO_UDO")
-
-    ### TRANSFORM ###
-    df_result = df_bind_atto_udo.select(
-        pl.col("ID_UDO_FK").str.strip_chars().alias("udo_id"),
-        pl.col("ID_ATTO_FK").str.strip_chars().alias("resolution_id"),
+    # Pure link table: trimmed in the source query and copied straight to PostgreSQL
+    copy_data(
+        ctx.oracle_engine_area,
+        "SELECT TRIM(ID_UDO_FK), TRIM(ID_ATTO_FK) FROM AUAC_USR.BIND_ATTO_UDO",
+        ctx.pg_engine_core,
+        "udo_resolutions",
+        ["udo_id", "resolution_id"],
     )
 
-    ### LOAD ###
-    load_data(ctx.pg_engine_core, df_result, "udo_resolutions")
-
 
 def migrate_udos_history(ctx: ETLContext) -> None:
     # TODO: Da rivedere completamente
@@ -1685,20 +1617,21 @@ def migrate_udos_history(ctx: ETLContext) -> None:
         ctx: The ETL context containing database connections
     """
     ### EXTRACT ###
-    # Extract main status data
-    df_stato_udo = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.STATO_UDO")
-
-    # Extract UDO data for supply information
-    df_udo = extract_data(
-        ctx.oracle_engine_area,
-        "SELECT CLIENTID, EROGAZIONE_DIRETTA, EROGAZIONE_INDIRETTA FROM AUAC_USR.UDO_MODEL",
-    )
-
-    # Extract bed history data
-    df_beds = extract_data(
+    dfs = extract_data_parallel(
         ctx.oracle_engine_area,
-        "SELECT ID_STATO_UDO_FK, PL, PLEX, PLOB FROM AUAC_USR.STORICO_POSTI_LETTO",
-    )
+        {
+            # Main status data
+            "stato_udo": "SELECT CLIENTID, ID_UDO_FK, STATO, SCADENZA, DATA_INIZIO, CREATION, LAST_MOD "
+            "FROM AUAC_USR.STATO_UDO",
+            # UDO data for supply information
+            "udo": "SELECT CLIENTID, EROGAZIONE_DIRETTA, EROGAZIONE_INDIRETTA FROM AUAC_USR.UDO_MODEL",
+            # Bed history data
+            "beds": "SELECT ID_STATO_UDO_FK, PL, PLEX, PLOB FROM AUAC_USR.STORICO_POSTI_LETTO",
+        },
+    )
+    df_stato_udo = dfs["stato_udo"]
+    df_udo = dfs["udo"]
+    df_beds = dfs["beds"]
 
     ### TRANSFORM ###
     # Clean and transform the main status data
@@ -1708,16 +1641,8 @@ def migrate_udos_history(ctx: ETLContext) -> None:
         pl.col("STATO").str.strip_chars().str.to_uppercase().alias("status"),
         pl.col("SCADENZA").alias("valid_to"),
         pl.col("DATA_INIZIO").alias("valid_from"),
-        pl.col("CREATION")
-        .fill_null(pl.col("LAST_MOD"))
-        .dt.replace_time_zone("Europe/Rome", ambiguous="earliest")
-        .dt.replace_time_zone(None)
-        .alias("created_at"),
-        pl.col("LAST_MOD")
-        .fill_null(pl.col("CREATION"))
-        .dt.replace_time_zone("Europe/Rome", ambiguous="earliest")
-        .dt.replace_time_zone(None)
-        .alias("updated_at"),
+        pl.col("CREATION").fill_null(pl.col("LAST_MOD")).alias("created_at"),
+        pl.col("LAST_MOD").fill_null(pl.col("CREATION")).alias("updated_at"),
     )
 
     # Replace specific status values
@@ -1726,14 +1651,8 @@ def migrate_udos_history(ctx: ETLContext) -> None:
     # Map supply information from UDO data
     df_udo = df_udo.select(
         pl.col("CLIENTID").str.strip_chars().alias("udo_id"),
-        pl.when(pl.col("EROGAZIONE_DIRETTA").str.strip_chars().str.to_lowercase() == "y")
-        .then(True)
-        .otherwise(False)
-        .alias("is_direct_supply"),
-        pl.when(pl.col("EROGAZIONE_INDIRETTA").str.strip_chars().str.to_lowercase() == "y")
-        .then(True)
-        .otherwise(False)
-        .alias("is_indirect_supply"),
+        handle_flag("EROGAZIONE_DIRETTA", "is_direct_supply", true_values=("y",)),
+        handle_flag("EROGAZIONE_INDIRETTA", "is_indirect_supply", true_values=("y",)),
     )
 
     # Join with UDO data to get supply information
@@ -1744,12 +1663,12 @@ def migrate_udos_history(ctx: ETLContext) -> None:
         how="left",
     )
 
-    # Map bed information from bed history data
+    # Map bed information from bed history data (nulls are filled once, after the join)
     df_beds = df_beds.select(
         pl.col("ID_STATO_UDO_FK").str.strip_chars().alias("id"),
-        pl.col("PL").cast(pl.UInt16, strict=False).fill_null(0).alias("beds"),
-        pl.col("PLEX").cast(pl.UInt16, strict=False).fill_null(0).alias("extra_beds"),
-        pl.col("PLOB").cast(pl.UInt16, strict=False).fill_null(0).alias("mortuary_beds"),
+        pl.col("PL").cast(pl.UInt16, strict=False).alias("beds"),
+        pl.col("PLEX").cast(pl.UInt16, strict=False).alias("extra_beds"),
+        pl.col("PLOB").cast(pl.UInt16, strict=False).alias("mortuary_beds"),
     )
 
     # Join with bed history data
@@ -1760,30 +1679,8 @@ def migrate_udos_history(ctx: ETLContext) -> None:
         how="left",
     )
 
-    # Fill null values for bed columns
-    df_result = df_result.with_columns(
-        pl.col("beds").fill_null(0),
-        pl.col("extra_beds").fill_null(0),
-        pl.col("mortuary_beds").fill_null(0),
-    )
-
-    # Verify UDO IDs exist in the udos table
-    try:
-        df_udos = pl.read_database(
-            "SELECT id FROM udos",
-            connection=ctx.pg_engine_core,
-            infer_schema_length=None,
-        )
-        logging.info("⛏️ Extracted UDO IDs from target database for validation")
-
-        # Convert to a list for filtering
-        valid_udo_ids = df_udos.select("id").to_series().to_list()
-
-        # Filter to include only records with valid UDO IDs
-        df_result = df_result.filter(pl.col("udo_id").is_in(valid_udo_ids))
-        logging.info(f"Filtered to {df_result.height} records with valid UDO IDs")
-    except Exception as e:
-        logging.warning(f"Could not validate UDO IDs: {e}")
+    # Fill null values for bed columns, both unparsable counts and statuses without bed history
+    df_result = df_result.with_columns(pl.col("beds", "extra_beds", "mortuary_beds").fill_null(0))
 
     # Let PostgreSQL generate new UUIDs for the records
     logging.info("Removing 'id' column to let PostgreSQL generate new UUIDs")
@@ -1798,7 +1695,8 @@ def migrate_udos_history(ctx: ETLContext) -> None:
         return
 
     ### LOAD ###
-    load_data(ctx.pg_engine_core, df_result, "udos_history")
+    # Rows referencing UDOs missing from the target database are dropped by PostgreSQL while loading
+    load_data(ctx.pg_engine_core, df_result, "udos_history", where="udo_id IN (SELECT id FROM udos)")
 
 
 ### USER ###
@@ -1823,10 +1721,21 @@ def migrate_users(ctx: ETLContext) -> None:
         The ETL context containing database connections
     """
     ### EXTRACT ###
-    df_utente_model = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.UTENTE_MODEL")
-    df_anagrafica_utente_model = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.ANAGRAFICA_UTENTE_MODEL")
-    df_uo_model = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.UO_MODEL")
-    df_municipalities = extract_data(ctx.pg_engine_core, "SELECT * FROM municipalities")
+    dfs = extract_data_parallel(
+        ctx.oracle_engine_area,
+        {
+            # Join each user's personal data to the user on the Oracle side, personal data without a user is skipped
+            "ANAGRAFICA_UTENTE_MODEL": "SELECT u.CLIENTID AS ID_UTENTE, u.USERNAME_CAS, u.RUOLO, u.PROVENIENZA_UO, "
+            "u.ID_UO, u.DATA_DISABILITATO, a.NOME, a.COGNOME, a.CFISC, a.EMAIL, a.DATA_NASCITA, a.COD_LUOGO_NASCITA, "
+            "a.VIA_PIAZZA, a.CIVICO, a.TELEFONO, a.CELLULARE, a.CARTA_IDENT_NUM, a.CARTA_IDENT_SCAD, a.PROFESSIONE, "
+            "a.CREATION, a.LAST_MOD FROM AUAC_USR.ANAGRAFICA_UTENTE_MODEL a "
+            "JOIN AUAC_USR.UTENTE_MODEL u ON u.ID_ANAGR_FK = a.CLIENTID",
+            "UO_MODEL": "SELECT CLIENTID, ID_UO FROM AUAC_USR.UO_MODEL",
+        },
+    )
+    df_anagrafica_utente_model = dfs["ANAGRAFICA_UTENTE_MODEL"].lazy()
+    df_uo_model = dfs["UO_MODEL"].lazy()
+    df_municipalities = extract_data(ctx.pg_engine_core, "SELECT istat_code, name FROM municipalities").lazy()
 
     ### TRANSFORM ###
     timestamp_exprs = handle_timestamps(direct_disabled_col="DATA_DISABILITATO")
@@ -1846,19 +1755,10 @@ def migrate_users(ctx: ETLContext) -> None:
         left_on="COD_LUOGO_NASCITA",
         right_on="istat_code",
         how="left",
-    ).join(
-        df_utente_model,
-        left_on="CLIENTID",
-        right_on="ID_ANAGR_FK",
-        how="left",
     )
 
     df_result = df_joined.select(
-        pl.col("CLIENTID_right")
-        .str.strip_chars()
-        .alias(
-            "id"
-        ),  # TODO: Non usare il campo "CLIENTID_right", è nascosto. Forse meglio girare la join per incrementare readability?
+        pl.col("ID_UTENTE").str.strip_chars().alias("id"),
         handle_text(source_col="USERNAME_CAS", target_col="username"),
         handle_enum_mapping(
             source_col="RUOLO",
@@ -1930,7 +1830,10 @@ def migrate_user_companies(ctx: ETLContext) -> None:
     # TODO: Legale rappresentante (is_legal_representative) -> TITOLARE_MODEL.ID_UTENTE_FK
 
     ### EXTRACT ###
-    df_operatore_model = extract_data(ctx.oracle_engine_area, "SELECT * FROM AUAC_USR.OPERATORE_MODEL")
+    df_operatore_model = extract_data(
+        ctx.oracle_engine_area,
+        "SELECT CLIENTID, ID_UTENTE_FK, ID_TITOLARE_FK, DISABLED, CREATION, LAST_MOD FROM AUAC_USR.OPERATORE_MODEL",
+    )
 
     ### TRANSFORM ###
     timestamp_exprs = handle_timestamps()
@@ -1958,7 +1861,8 @@ def migrate_core(ctx: ETLContext) -> None:
 
     This function orchestrates the complete ETL process for the Core service,
     first truncating all target tables and then migrating each entity type
-    in the correct sequence.
+    concurrently, each one as soon as the tables it references through foreign
+    keys (or reads back from the target database) have been loaded.
 
     Parameters
     ----------
@@ -1966,31 +1870,42 @@ def migrate_core(ctx: ETLContext) -> None:
         The ETL context containing database connections
     """
     truncate_core_tables(ctx)
-    migrate_regions(ctx)
-    migrate_provinces(ctx)
-    migrate_municipalities(ctx)
-    migrate_toponyms(ctx)
-    migrate_districts(ctx)
-    migrate_ulss(ctx)
-    migrate_company_types(ctx)
-    migrate_companies(ctx)
-    migrate_physical_structures(ctx)
-    migrate_operational_offices(ctx)
-    migrate_buildings(ctx)
-    migrate_grouping_specialties(ctx)
-    migrate_specialties(ctx)
-    migrate_resolution_types(ctx)
-    migrate_resolutions(ctx)
-    migrate_operational_units(ctx)
-    migrate_production_factor_types(ctx)
-    migrate_production_factors(ctx)
-    migrate_udo_type_classifications(ctx)
-    migrate_udo_types(ctx)
-    migrate_udos(ctx)
-    migrate_udo_production_factors(ctx)
-    migrate_udo_resolutions(ctx)
-    migrate_udo_specialties(ctx)
-    migrate_udo_type_production_factor_types(ctx)
-    migrate_users(ctx)
-    migrate_permissions(ctx)
-    migrate_user_companies(ctx)
+    run_migrations(
+        ctx,
+        {
+            migrate_regions: [],
+            migrate_provinces: [migrate_regions],
+            migrate_municipalities: [migrate_provinces],
+            migrate_toponyms: [],
+            migrate_districts: [],
+            migrate_ulss: [],
+            migrate_company_types: [],
+            migrate_companies: [migrate_company_types, migrate_municipalities, migrate_toponyms],
+            migrate_physical_structures: [migrate_companies, migrate_districts],
+            migrate_operational_offices: [migrate_physical_structures, migrate_municipalities, migrate_toponyms],
+            migrate_buildings: [migrate_physical_structures],
+            migrate_grouping_specialties: [],
+            migrate_specialties: [migrate_grouping_specialties],
+            migrate_resolution_types: [],
+            migrate_resolutions: [migrate_companies, migrate_resolution_types],
+            migrate_operational_units: [migrate_companies],
+            migrate_production_factor_types: [],
+            migrate_production_factors: [migrate_production_factor_types],
+            migrate_udo_type_classifications: [],
+            migrate_udo_types: [migrate_udo_type_classifications],
+            migrate_udos: [
+                migrate_udo_types,
+                migrate_operational_offices,
+                migrate_buildings,
+                migrate_companies,
+                migrate_operational_units,
+            ],
+            migrate_udo_production_factors: [migrate_udos, migrate_production_factors],
+            migrate_udo_resolutions: [migrate_udos, migrate_resolutions],
+            migrate_udo_specialties: [migrate_udos, migrate_specialties],
+            migrate_udo_type_production_factor_types: [migrate_udo_types, migrate_production_factor_types],
+            migrate_users: [migrate_operational_units, migrate_municipalities],
+            migrate_permissions: [],
+            migrate_user_companies: [migrate_users, migrate_companies],
+        },
+    )
@@ -2,7 +2,7 @@ import logging
 
 import polars as pl
 
-from utils import ETLContext, extract_data, handle_text, load_data, truncate_pg_table
+from utils import ETLContext, extract_data, handle_text, load_data, truncate_pg_tables
 
 CRONOS_TABLES = [
     "cronos_companies",
@@ -28,8 +28,7 @@ def truncate_cronos_tables(ctx: ETLContext) -> None:
     """
     logging.info(f"Truncating all target tables in PostgreSQL {ctx.pg_engine_cronos}...")
 
-    for table in CRONOS_TABLES:
-        truncate_pg_table(ctx.pg_engine_cronos, table)
+    truncate_pg_tables(ctx.pg_engine_cronos, CRONOS_TABLES)
 
 
 def migrate_cronos_taxonomies(ctx: ETLContext) -> None:
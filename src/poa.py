@@ -1,6 +1,6 @@
 import logging
 
-from utils import ETLContext, truncate_pg_table
+from utils import ETLContext, truncate_pg_tables
 
 POA_TABLES = [
     "areas",
@@ -33,8 +33,7 @@ def truncate_poa_tables(ctx: ETLContext) -> None:
     """
     logging.info(f"Truncating all target tables in PostgreSQL {ctx.pg_engine_poa}...")
 
-    for table in POA_TABLES:
-        truncate_pg_table(ctx.pg_engine_poa, table)
+    truncate_pg_tables(ctx.pg_engine_poa, POA_TABLES)
 
 
 def migrate_poa(ctx: ETLContext) -> None:
@@ -57,6 +57,21 @@ class Settings(BaseSettings):
         Secret key for MinIO object storage
     ATTACHMENTS_DIR: str
         Directory for storing attachments
+    EXTRACT_CHECKPOINT_DIR: str
+        Directory where extracted source tables are checkpointed as Parquet files and reused on retries. An empty
+        value disables checkpointing. Each run keeps its checkpoints in its own subdirectory, which is deleted once
+        the run completes successfully.
+    EXTRACT_CHECKPOINT_RUN_ID: str
+        Id of a failed run, i.e. the name of its checkpoint subdirectory, whose checkpoints are reused by a retry.
+        An empty value starts a new run with fresh checkpoints.
+    EXTRACT_WITH_CONNECTORX: bool
+        Whether to extract source tables with connectorx instead of SQLAlchemy. The Oracle Instant Client libraries
+        must then be reachable through the library search path, as ORACLE_CLIENT_LIB_DIR only applies to cx_Oracle.
+    MIGRATION_WORKERS: int
+        Maximum number of independent table migrations run concurrently within a service
+    DB_POOL_SIZE: int
+        Maximum number of connections opened by the connection pool of each database engine. Concurrent
+        migrations and extracts needing more connections wait for one to be returned
     """
 
     ORACLE_CLIENT_LIB_DIR: str = "/path/to/instantclient"
@@ -71,6 +86,11 @@ class Settings(BaseSettings):
     MINIO_ACCESS_KEY: str = "minioadmin"
     MINIO_SECRET_KEY: str = "minioadmin"
     ATTACHMENTS_DIR: str = "attachments"
+    EXTRACT_CHECKPOINT_DIR: str = ""
+    EXTRACT_CHECKPOINT_RUN_ID: str = ""
+    EXTRACT_WITH_CONNECTORX: bool = False
+    MIGRATION_WORKERS: int = 4
+    DB_POOL_SIZE: int = 8
 
     model_config = SettingsConfigDict(
         env_file=find_env_file(),
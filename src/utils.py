@@ -1,5 +1,17 @@
+import atexit
+import concurrent.futures
+import csv
+import functools
+import hashlib
+import io
 import logging
+import logging.handlers
 import os
+import queue
+import re
+import shutil
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -12,12 +24,25 @@ from sqlalchemy import Engine, create_engine, text
 
 from settings import settings
 
+# Naive UTC start time of this ETL run, used to fill missing creation/modification timestamps so every table
+# migrated in the same run gets the same placeholder
+RUN_STARTED_AT = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
 
-@dataclass
+# Subdirectory of EXTRACT_CHECKPOINT_DIR holding the extract checkpoints of this run: a retry reuses the checkpoints
+# of a failed run only when its id is passed explicitly through EXTRACT_CHECKPOINT_RUN_ID
+CHECKPOINT_RUN_ID = settings.EXTRACT_CHECKPOINT_RUN_ID or RUN_STARTED_AT.strftime("%Y%m%d_%H%M%S")
+
+# First table named after a FROM keyword in a query, used to label extracts in logs and checkpoint file names
+QUERY_TABLE_PATTERN = re.compile(r"\bFROM\s+([\w.\"]+)", re.IGNORECASE)
+
+
+@dataclass(slots=True, frozen=True)
 class ETLContext:
     """
     Context object for ETL operations containing database connections.
 
+    The context is immutable and shared by all the migrations running concurrently.
+
     Attributes
     ----------
     oracle_engine_area : Engine
@@ -50,21 +75,52 @@ def setup_logging() -> None:
     Set up the logging configuration for the application.
 
     Creates a logs directory if it doesn't exist and configures logging
-    to output to both console and a timestamped log file.
+    to output to both console and a timestamped log file. The output is
+    written by a background thread fed through a queue. Calling it again
+    once logging is configured does nothing, and the log file is only
+    created when the first record is written.
     """
+    if logging.getLogger().handlers:
+        return
+
     log_dir = Path("logs")
     log_dir.mkdir(parents=True, exist_ok=True)
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s | %(levelname)s | %(message)s",
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler(
-                f"logs/area_etl_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log",
-                mode="a",
-            ),
-        ],
-    )
+    formatter = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
+    handlers = [
+        logging.StreamHandler(),
+        logging.FileHandler(
+            f"logs/area_etl_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log",
+            mode="a",
+            encoding="utf-8",
+            delay=True,
+        ),
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # The format does not use thread or process names, skip looking them up for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    # Migrations log from several worker threads: records are only enqueued by the caller, a background listener
+    # does the console and file writes
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[logging.handlers.QueueHandler(log_queue)])
+
+
+@functools.cache
+def init_oracle_client_once() -> None:
+    """
+    Initialize the Oracle Instant Client libraries from ``ORACLE_CLIENT_LIB_DIR``.
+
+    cx_Oracle can load the client libraries only once per process: later calls return immediately instead of failing,
+    so ``setup_connections`` can be called again in the same process.
+    """
+    init_oracle_client(lib_dir=settings.ORACLE_CLIENT_LIB_DIR)
 
 
 def setup_connections() -> ETLContext:
@@ -90,6 +146,11 @@ def setup_connections() -> ETLContext:
     - ``MINIO_ACCESS_KEY``: Access key for MinIO.
     - ``MINIO_SECRET_KEY``: Secret key for MinIO.
     - ``ATTACHMENTS_DIR``: Directory for storing attachments.
+    - ``EXTRACT_CHECKPOINT_DIR``: Directory for Parquet checkpoints of extracted tables (empty disables them).
+    - ``EXTRACT_CHECKPOINT_RUN_ID``: Id of a failed run whose checkpoints a retry reuses (empty starts a new run).
+    - ``EXTRACT_WITH_CONNECTORX``: Whether to extract source tables with connectorx instead of SQLAlchemy.
+    - ``MIGRATION_WORKERS``: Maximum number of table migrations run concurrently.
+    - ``DB_POOL_SIZE``: Maximum number of connections opened by the pool of each database engine.
 
     MinIO security:
 
@@ -100,13 +161,27 @@ def setup_connections() -> ETLContext:
     ETLContext
         Context object containing all database connections and the MinIO client.
     """
-    init_oracle_client(lib_dir=settings.ORACLE_CLIENT_LIB_DIR)
-    oracle_engine_area = create_engine(settings.ORACLE_URI_AREA)
-    oracle_engine_poa = create_engine(settings.ORACLE_URI_POA)
-    pg_engine_core = create_engine(settings.PG_URI_CORE)
-    pg_engine_poa = create_engine(settings.PG_URI_POA)
-    pg_engine_cronos = create_engine(settings.PG_URI_CRONOS)
-    pg_engine_auac = create_engine(settings.PG_URI_AUAC)
+    init_oracle_client_once()
+
+    def build_engine(uri: str) -> Engine:
+        # At most DB_POOL_SIZE sessions are opened per database: concurrent migrations and extracts needing more
+        # wait for a connection to be returned, however long that takes. Pooled connections are checked before use
+        # and recycled hourly, as they may sit idle during long transforms
+        return create_engine(
+            uri,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=0,
+            pool_timeout=None,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+        )
+
+    oracle_engine_area = build_engine(settings.ORACLE_URI_AREA)
+    oracle_engine_poa = build_engine(settings.ORACLE_URI_POA)
+    pg_engine_core = build_engine(settings.PG_URI_CORE)
+    pg_engine_poa = build_engine(settings.PG_URI_POA)
+    pg_engine_cronos = build_engine(settings.PG_URI_CRONOS)
+    pg_engine_auac = build_engine(settings.PG_URI_AUAC)
 
     # Build MinIO client with robust endpoint handling
     raw_endpoint = settings.MINIO_ENDPOINT.strip()
@@ -147,40 +222,159 @@ def setup_connections() -> ETLContext:
     )
 
 
-def extract_data(engine: Engine, query: str) -> pl.DataFrame:
+def extract_data(engine: Engine, query: str, schema_overrides: dict[str, pl.DataType] | None = None) -> pl.DataFrame:
     """
     Extract data from a database using a SQL query.
 
     This function executes the provided SQL query against the database connection
     and returns the results as a Polars DataFrame.
 
+    When ``EXTRACT_CHECKPOINT_DIR`` is set, every result extracted from a source (non-PostgreSQL) database is
+    persisted as a zstd-compressed Parquet file, in the subdirectory of the current run, keyed by engine, query and
+    schema overrides. A later call with the same arguments in the same run, or in a retry started with
+    ``EXTRACT_CHECKPOINT_RUN_ID`` set to the id of the failed run, reads the checkpoint instead of querying the
+    database again. Read-backs of the target PostgreSQL databases are never checkpointed, as earlier migrations of
+    the run change them.
+
+    When ``EXTRACT_WITH_CONNECTORX`` is enabled, the query is run through connectorx, which fetches straight into
+    Arrow memory instead of building Python row objects through the SQLAlchemy cursor.
+
     Parameters
     ----------
     engine : Engine
         The SQLAlchemy engine connection to the database
     query : str
         The SQL query to execute
+    schema_overrides : dict[str, pl.DataType] | None, optional
+        Data types of result columns known in advance, which are then built directly instead of being inferred
+        from the fetched rows, by default None
 
     Returns
     -------
     pl.DataFrame
         A polars DataFrame containing the query results
     """
-    df = pl.read_database(query, connection=engine.connect(), infer_schema_length=None)
-
     # Extract the table name from the input query for logging
-    table_name = "unknown"
-    if "FROM" in query.upper():
-        parts = query.upper().split("FROM")
-        if len(parts) > 1:
-            table_parts = parts[1].strip().split()
-            if table_parts:
-                table_name = table_parts[0]
-
+    match = QUERY_TABLE_PATTERN.search(query)
+    table_name = match.group(1).upper() if match else "unknown"
+
+    checkpoint_path = None
+    if settings.EXTRACT_CHECKPOINT_DIR and engine.dialect.name != "postgresql":
+        checkpoint_dir = Path(settings.EXTRACT_CHECKPOINT_DIR) / CHECKPOINT_RUN_ID
+        checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        overrides = sorted((schema_overrides or {}).items())
+        query_hash = hashlib.sha1(f"{engine.url}|{query}|{overrides}".encode()).hexdigest()[:12]
+        checkpoint_path = checkpoint_dir / f"{table_name.lower()}_{query_hash}.parquet"
+
+        if checkpoint_path.exists():
+            df = pl.read_parquet(checkpoint_path)
+            logging.info(f'Extracted {df.height} rows for table "{table_name}" from checkpoint {checkpoint_path}')
+            return df
+
+    if settings.EXTRACT_WITH_CONNECTORX:
+        # connectorx expects the plain "<backend>://" form of the URI, without the SQLAlchemy driver suffix
+        uri = engine.url.set(drivername=engine.url.get_backend_name()).render_as_string(hide_password=False)
+        df = pl.read_database_uri(query, uri, engine="connectorx", schema_overrides=schema_overrides)
+    else:
+        with engine.connect() as conn:
+            df = pl.read_database(query, connection=conn, infer_schema_length=None, schema_overrides=schema_overrides)
     logging.info(f'Extracted {df.height} rows from {engine} table "{table_name}"')
+
+    if checkpoint_path is not None:
+        # Write to a temporary file first, so that an interrupted write never leaves a truncated checkpoint behind
+        tmp_path = checkpoint_path.with_name(f"{checkpoint_path.name}.{threading.get_ident()}.tmp")
+        df.write_parquet(tmp_path, compression="zstd")
+        tmp_path.replace(checkpoint_path)
+
     return df
 
 
+def clear_extract_checkpoints() -> None:
+    """
+    Delete the extract checkpoints of the current run.
+
+    This is meant to be called once the whole run has completed successfully, as its checkpoints are then no longer
+    needed for a retry. Nothing happens when checkpointing is disabled.
+    """
+    if not settings.EXTRACT_CHECKPOINT_DIR:
+        return
+
+    checkpoint_dir = Path(settings.EXTRACT_CHECKPOINT_DIR) / CHECKPOINT_RUN_ID
+    if checkpoint_dir.exists():
+        shutil.rmtree(checkpoint_dir)
+        logging.info(f"Deleted extract checkpoints of run {CHECKPOINT_RUN_ID} in {checkpoint_dir}")
+
+
+def extract_data_parallel(
+    engine: Engine, queries: dict[str, str], max_workers: int | None = None
+) -> dict[str, pl.DataFrame]:
+    """
+    Extract data from a database running several independent SQL queries concurrently.
+
+    Each query is executed with ``extract_data`` on its own pooled connection in a thread pool, so the total wall
+    time is close to that of the slowest query instead of the sum of all of them.
+
+    Parameters
+    ----------
+    engine : Engine
+        The SQLAlchemy engine connection to the database
+    queries : dict[str, str]
+        Mapping from an arbitrary key to the SQL query to execute
+    max_workers : int | None
+        Maximum number of concurrent queries (defaults to one worker per query, up to ``DB_POOL_SIZE``)
+
+    Returns
+    -------
+    dict[str, pl.DataFrame]
+        A mapping from each key of ``queries`` to the polars DataFrame with its results
+    """
+    max_workers = max_workers or min(len(queries), settings.DB_POOL_SIZE)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {key: executor.submit(extract_data, engine, query) for key, query in queries.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+
+def run_migrations(
+    ctx: ETLContext, dependencies: dict[Callable[[ETLContext], None], list[Callable[[ETLContext], None]]]
+) -> None:
+    """
+    Run table migrations concurrently, each one as soon as all the migrations it depends on have completed.
+
+    Up to ``MIGRATION_WORKERS`` migrations run at the same time, but never more than ``DB_POOL_SIZE``: every
+    migration checks its connections out of the bounded pools of the ``ctx`` engines, so extra workers would only
+    wait for a free connection. Once a migration fails no new migration is started, the ones already running are
+    awaited, and the failure is re-raised.
+
+    Parameters
+    ----------
+    ctx : ETLContext
+        The ETL context containing database connections
+    dependencies : dict[Callable[[ETLContext], None], list[Callable[[ETLContext], None]]]
+        Mapping from every migration function to the migrations that must complete before it starts (e.g. the ones
+        loading the tables it references through foreign keys or reads back from the target database)
+    """
+    pending = dict(dependencies)
+    completed: set[Callable[[ETLContext], None]] = set()
+
+    max_workers = min(settings.MIGRATION_WORKERS, settings.DB_POOL_SIZE)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running: dict[concurrent.futures.Future, Callable[[ETLContext], None]] = {}
+        while pending or running:
+            for migration in [m for m, deps in pending.items() if completed.issuperset(deps)]:
+                del pending[migration]
+                running[executor.submit(migration, ctx)] = migration
+
+            if not running:
+                msg = f"Unsatisfiable migration dependencies: {[m.__name__ for m in pending]}"
+                raise ValueError(msg)
+
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                migration = running.pop(future)
+                future.result()
+                completed.add(migration)
+
+
 def extract_data_from_csv(file_path: str | os.PathLike, schema_overrides: dict | None = None) -> pl.DataFrame:
     """
     Extract data from a CSV file and log the extraction.
@@ -203,52 +397,166 @@ def extract_data_from_csv(file_path: str | os.PathLike, schema_overrides: dict |
     return df
 
 
-def load_data(engine: Engine, df: pl.DataFrame, table_name: str) -> None:
+def load_data(engine: Engine, df: pl.DataFrame | pl.LazyFrame, table_name: str, where: str | None = None) -> None:
     """
-    Load data from a Polars DataFrame into a database table.
+    Load data from a Polars DataFrame or LazyFrame into a database table.
+
+    The rows are first streamed with ``COPY ... FROM STDIN (FORMAT CSV)`` into an ``UNLOGGED`` staging table shaped
+    like the target (no WAL, no indexes or constraints to maintain during the copy), then moved into the target table
+    with a single ``INSERT ... SELECT``. Everything runs in one transaction and the staging table is dropped afterwards.
+    List columns are sent as PostgreSQL array literals.
 
-    This function writes the contents of the provided DataFrame to the specified
-    database table, appending to the table if it already exists.
+    A LazyFrame is never collected in full: its plan is streamed with ``sink_csv`` through a pipe straight into the
+    ``COPY``, so peak memory stays bounded by the streaming engine's batch size rather than by the table size.
 
     Parameters
     ----------
     engine : Engine
-        The SQLAlchemy engine connection to the database
-    df : pl.DataFrame
-        The Polars DataFrame containing the data to load
+        The SQLAlchemy engine connection to the PostgreSQL database
+    df : pl.DataFrame | pl.LazyFrame
+        The Polars DataFrame or LazyFrame containing the data to load
     table_name : str
         The name of the target database table
+    where : str | None
+        Optional SQL condition on the staged rows; only rows satisfying it are moved into the target table (e.g.
+        ``"udo_id IN (SELECT id FROM udos)"`` to drop rows referencing missing parents)
+    """
+    staging_table = f"{table_name}_stg"
+    schema = df.collect_schema()
+    columns = ", ".join(f'"{col}"' for col in schema.names())
+
+    # CSV has no nested types: render list columns as PostgreSQL array literals ('{"a","b"}') in a single pass
+    df = df.with_columns(
+        pl.concat_str(
+            pl.lit("{"),
+            pl.col(col)
+            .list.eval('"' + pl.element().cast(pl.String).str.replace_all(r"([\\\"])", r"\$1") + '"')
+            .list.join(","),
+            pl.lit("}"),
+        ).alias(col)
+        for col, dtype in schema.items()
+        if isinstance(dtype, pl.List)
+    )
+
+    def sink_csv(lazy_df: pl.LazyFrame, fd: int) -> None:
+        with os.fdopen(fd, "wb") as sink:
+            lazy_df.sink_csv(sink, include_header=False)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        sink_future = None
+        if isinstance(df, pl.LazyFrame):
+            # A writer thread streams the CSV into one end of a pipe while COPY reads it from the other end
+            read_fd, write_fd = os.pipe()
+            sink_future = executor.submit(sink_csv, df, write_fd)
+            source = os.fdopen(read_fd, "rb")
+        else:
+            source = io.BytesIO()
+            df.write_csv(source, include_header=False)
+            source.seek(0)
+
+        with source, engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {staging_table}"))
+            conn.execute(text(f"CREATE UNLOGGED TABLE {staging_table} (LIKE {table_name} INCLUDING DEFAULTS)"))
+            with conn.connection.cursor() as cursor:
+                cursor.copy_expert(f"COPY {staging_table} ({columns}) FROM STDIN WITH (FORMAT CSV)", source)
+            if sink_future is not None:
+                # A failed sink closes the pipe early, which COPY takes for a clean end of data: re-raise its error
+                # here so the transaction is rolled back
+                sink_future.result()
+            where_clause = f" WHERE {where}" if where else ""
+            inserted = conn.execute(
+                text(f"INSERT INTO {table_name} ({columns}) SELECT {columns} FROM {staging_table}{where_clause}")
+            ).rowcount
+            conn.execute(text(f"DROP TABLE {staging_table}"))
+
+    logging.info(f'Loaded {inserted} rows in {engine} table "{table_name}"')
+
+
+def copy_data(
+    source_engine: Engine,
+    query: str,
+    target_engine: Engine,
+    table_name: str,
+    columns: list[str],
+) -> None:
+    """
+    Copy the result of a SQL query straight into a PostgreSQL table, without building a DataFrame.
+
+    Meant for tables that need no transformation besides what the source query itself can do (e.g. ``TRIM`` and
+    column selection). Rows are fetched from the source cursor in batches of 50,000 and each batch is streamed into
+    the target table with ``COPY ... FROM STDIN (FORMAT CSV)``, all in one target transaction.
+
+    Parameters
+    ----------
+    source_engine : Engine
+        The SQLAlchemy engine connection to the source database
+    query : str
+        The SQL query whose result rows are copied
+    target_engine : Engine
+        The SQLAlchemy engine connection to the PostgreSQL database
+    table_name : str
+        The name of the target database table
+    columns : list[str]
+        The target columns, in the same order as the columns returned by ``query``
     """
-    df.write_database(table_name=table_name, connection=engine, if_table_exists="append")
-    logging.info(f'Loaded {df.height} rows in {engine} table "{table_name}"')
+    column_list = ", ".join(f'"{col}"' for col in columns)
+    copy_sql = f"COPY {table_name} ({column_list}) FROM STDIN WITH (FORMAT CSV)"
+    copied = 0
+
+    with source_engine.connect() as source_conn, target_engine.begin() as target_conn:
+        source_cursor = source_conn.connection.cursor()
+        source_cursor.arraysize = 50_000
+        source_cursor.execute(query)
+
+        with target_conn.connection.cursor() as target_cursor:
+            while rows := source_cursor.fetchmany():
+                buffer = io.StringIO()
+                csv.writer(buffer, lineterminator="\n").writerows(rows)
+                buffer.seek(0)
+                target_cursor.copy_expert(copy_sql, buffer)
+                copied += len(rows)
+
+        source_cursor.close()
 
+    logging.info(f'Copied {copied} rows from {source_engine} into {target_engine} table "{table_name}"')
 
-def truncate_pg_table(engine: Engine, table: str) -> None:
+
+def truncate_pg_tables(engine: Engine, tables: list[str]) -> None:
     """
-    Truncate a specific PostgreSQL table.
+    Truncate a set of PostgreSQL tables.
 
-    This function executes a TRUNCATE TABLE command with CASCADE option on the specified table,
-    which removes all rows from the table and resets any identity columns.
+    This function executes a single TRUNCATE TABLE command with CASCADE option on all the specified tables,
+    which removes all rows from the tables and resets any identity columns at once. Being a single statement,
+    it is run in autocommit mode, without an explicit transaction around it.
 
     Parameters
     ----------
     engine : Engine
         The SQLAlchemy engine connection to the PostgreSQL database
-    table : str
-        The name of the table to truncate
+    tables : list[str]
+        The names of the tables to truncate
     """
-    with engine.connect() as conn:
-        logging.info(f'Truncating PostgreSQL {engine} database table "{table}"...')
-        conn.execute(text(f"TRUNCATE TABLE {table} RESTART IDENTITY CASCADE"))
-        conn.commit()
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        logging.info(f"Truncating {len(tables)} PostgreSQL {engine} database tables...")
+        conn.execute(text(f"TRUNCATE TABLE {', '.join(tables)} RESTART IDENTITY CASCADE"))
 
 
-def export_tables_to_csv(engine: Engine, tables: list[str], export_dir: str = "export") -> None:
+def export_tables_to_csv(
+    engine: Engine,
+    tables: list[str],
+    export_dir: str = "export",
+    max_workers: int | None = None,
+    batch_size: int = 100_000,
+) -> None:
     """
     Export database tables to CSV files.
 
     This function extracts data from the specified database tables and saves each
-    table as a separate CSV file in the specified export directory.
+    table as a separate CSV file in the specified export directory. Tables are
+    exported concurrently, each one on its own pooled connection. PostgreSQL tables
+    are written by the server with ``COPY ... TO STDOUT`` without going through polars,
+    while tables of other databases are fetched and appended to the file in batches,
+    so that no table is ever fully materialized in memory.
 
     Parameters
     ----------
@@ -258,17 +566,43 @@ def export_tables_to_csv(engine: Engine, tables: list[str], export_dir: str = "e
         A list of table names to export
     export_dir : str, optional
         The directory where CSV files will be saved, by default "export"
+    max_workers : int | None
+        Maximum number of tables exported at the same time (defaults to ``MIGRATION_WORKERS``)
+    batch_size : int, optional
+        Number of rows fetched and written at a time for non-PostgreSQL databases, by default 100000
     """
     export_path = Path(export_dir).absolute()
     export_path.mkdir(parents=True, exist_ok=True)
 
     logging.info(f"Exporting selected tables to CSV in directory: {export_path}")
 
-    for table in tables:
-        df = extract_data(engine, f"SELECT * FROM {table}")
+    def export_table(table: str) -> None:
         csv_path = export_path / f"{table}.csv"
-        df.to_pandas().to_csv(csv_path, index=False)
-        logging.info(f"Exported {df.height} rows from {engine} database table {table} to {csv_path}")
+        if engine.dialect.name == "postgresql":
+            # Let PostgreSQL render the CSV itself and stream it straight into the file
+            with engine.connect() as conn, conn.connection.cursor() as cursor, csv_path.open("wb") as csv_file:
+                cursor.copy_expert(f"COPY {table} TO STDOUT WITH (FORMAT CSV, HEADER)", csv_file)
+                exported = cursor.rowcount
+        else:
+            exported = 0
+            header_written = False
+            with engine.connect() as conn, csv_path.open("wb") as csv_file:
+                result = conn.execution_options(stream_results=True).exec_driver_sql(f"SELECT * FROM {table}")
+                columns = list(result.keys())
+                for rows in result.partitions(batch_size):
+                    batch = pl.DataFrame(rows, schema=columns, orient="row", infer_schema_length=None)
+                    # Only the first batch carries the header, the others are appended below it
+                    batch.write_csv(csv_file, include_header=not header_written)
+                    header_written = True
+                    exported += batch.height
+                if not header_written:
+                    # Empty table: still write the header, taken from the cursor description
+                    pl.DataFrame(schema=columns).write_csv(csv_file)
+        logging.info(f"Exported {exported} rows from {engine} database table {table} to {csv_path}")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or settings.MIGRATION_WORKERS) as executor:
+        # Consume the results so that the first failed export is re-raised
+        list(executor.map(export_table, tables))
 
     logging.info(f"Export completed. CSV files saved in {export_path} directory")
 
@@ -279,15 +613,14 @@ def handle_created_at(creation_col: str = "CREATION", current_time: datetime | N
 
     This function applies the standard transformation for created_at fields:
     - Uses the specified creation column from the source
-    - Fills null values with provided current_time or generates a new UTC time if not provided
-    - Replaces timezone from "Europe/Rome" to None
+    - Fills null values with provided current_time or the run start time if not provided
 
     Parameters
     ----------
     creation_col : str, optional
         The name of the creation timestamp column, by default "CREATION"
     current_time : datetime, optional
-        A timestamp to use for null values, by default None (will use current time)
+        A timestamp to use for null values, by default None (will use RUN_STARTED_AT)
 
     Returns
     -------
@@ -295,15 +628,9 @@ def handle_created_at(creation_col: str = "CREATION", current_time: datetime | N
         A polars expression that can be used in a select statement
     """
     if current_time is None:
-        current_time = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+        current_time = RUN_STARTED_AT
 
-    return (
-        pl.col(creation_col)
-        .fill_null(current_time)
-        .dt.replace_time_zone("Europe/Rome", ambiguous="earliest")
-        .dt.replace_time_zone(None)
-        .alias("created_at")
-    )
+    return pl.col(creation_col).fill_null(current_time).alias("created_at")
 
 
 def handle_updated_at(
@@ -317,8 +644,7 @@ def handle_updated_at(
     This function applies the standard transformation for updated_at fields:
     - Uses the specified last modification column from the source
     - Fills null values with the creation column
-    - If both last_mod_col and creation_col are null, uses the provided current_time or generates a new timestamp
-    - Replaces timezone from "Europe/Rome" to None
+    - If both last_mod_col and creation_col are null, uses the provided current_time or the run start time
 
     Parameters
     ----------
@@ -327,7 +653,7 @@ def handle_updated_at(
     creation_col : str, optional
         The name of the creation timestamp column, by default "CREATION"
     current_time : datetime, optional
-        A timestamp to use when both columns are null, by default None (will use current time)
+        A timestamp to use when both columns are null, by default None (will use RUN_STARTED_AT)
 
     Returns
     -------
@@ -335,16 +661,9 @@ def handle_updated_at(
         A polars expression that can be used in a select statement
     """
     if current_time is None:
-        current_time = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+        current_time = RUN_STARTED_AT
 
-    return (
-        pl.col(last_mod_col)
-        .fill_null(pl.col(creation_col))
-        .fill_null(current_time)
-        .dt.replace_time_zone("Europe/Rome", ambiguous="earliest")
-        .dt.replace_time_zone(None)
-        .alias("updated_at")
-    )
+    return pl.col(last_mod_col).fill_null(pl.col(creation_col)).fill_null(current_time).alias("updated_at")
 
 
 def handle_disabled_at(
@@ -361,7 +680,6 @@ def handle_disabled_at(
     - If direct_disabled_col is provided, uses that column directly
     - Otherwise, conditionally sets when disabled_col equals disabled_value
     - When condition is met, uses last_mod_col (with fallback to creation_col)
-    - Replaces timezone from "Europe/Rome" to None
     - Otherwise sets to None
 
     Parameters
@@ -387,12 +705,7 @@ def handle_disabled_at(
 
     return (
         pl.when(pl.col(disabled_col) == disabled_value)
-        .then(
-            pl.col(last_mod_col)
-            .fill_null(pl.col(creation_col))
-            .dt.replace_time_zone("Europe/Rome", ambiguous="earliest")
-            .dt.replace_time_zone(None)
-        )
+        .then(pl.coalesce(last_mod_col, creation_col))
         .otherwise(None)
         .alias("disabled_at")
     )
@@ -409,7 +722,8 @@ def handle_timestamps(
     Handle all timestamp field transformations at once.
 
     This function applies the standard transformations for created_at, updated_at, and disabled_at fields.
-    It ensures that created_at and updated_at use the same timestamp when both source columns are null.
+    Null created_at and updated_at values are both filled with the run start time, RUN_STARTED_AT.
+    Source timestamps are naive Europe/Rome wall-clock values and are passed through unchanged.
 
     Parameters
     ----------
@@ -429,12 +743,9 @@ def handle_timestamps(
     dict[str, pl.Expr]
         A dictionary of polars expressions that can be used in a select statement
     """
-    # Generate a single timestamp to use for both created_at and updated_at when source columns are null
-    current_time = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
-
     return {
-        "created_at": handle_created_at(creation_col, current_time),
-        "updated_at": handle_updated_at(last_mod_col, creation_col, current_time),
+        "created_at": handle_created_at(creation_col),
+        "updated_at": handle_updated_at(last_mod_col, creation_col),
         "disabled_at": handle_disabled_at(
             disabled_col, disabled_value, last_mod_col, creation_col, direct_disabled_col
         ),
@@ -465,37 +776,13 @@ def handle_id(source_id_col: str = "CLIENTID", target_id_col: str = "id") -> pl.
     return pl.col(source_id_col).cast(pl.String).str.strip_chars().str.to_lowercase().alias(target_id_col)
 
 
-def map_value(value: str | None, mapping: dict[str, str], default: str | None = None) -> str | None:
-    """
-    Map values using a dictionary.
-
-    Parameters
-    ----------
-    value : str or None
-        The value to map
-    mapping : dict[str, str]
-        Dictionary containing the mapping from input values to standardized values
-    default : str or None, optional
-        Default value to return if no mapping exists. If None, returns None.
-
-    Returns
-    -------
-    str or None
-        The mapped value, or default if no mapping exists
-    """
-    if value is None:
-        return default
-
-    value = value.strip().lower()
-    return mapping.get(value, default)
-
-
 def handle_enum_mapping(source_col: str, target_col: str, mapping_dict: dict, default: str | None = None) -> pl.Expr:
     """
     Map values from a source column to standardized values using a mapping dictionary.
 
     This function applies string transformations (strip and lowercase) before mapping
     and returns a polars expression that can be used in a select statement.
+    The lookup runs natively in Polars; null values and values missing from the mapping both become ``default``.
 
     Parameters
     ----------
@@ -517,7 +804,7 @@ def handle_enum_mapping(source_col: str, target_col: str, mapping_dict: dict, de
         pl.col(source_col)
         .str.strip_chars()
         .str.to_lowercase()
-        .map_elements(lambda x: map_value(x, mapping_dict, default=default), return_dtype=pl.String)
+        .replace_strict(mapping_dict, default=default, return_dtype=pl.String)
         .alias(target_col)
     )
 
@@ -569,8 +856,7 @@ def handle_text(source_col: str, target_col: str) -> pl.Expr:
         pl.col(source_col)
         .cast(pl.String)
         .str.strip_chars()
-        .str.replace_all("\n", "")
-        .str.replace_all("\r", "")
+        .str.replace_all(r"[\r\n]", "")
         .str.replace_all(r"\s+", " ")
         .alias(target_col)
     )
@@ -617,3 +903,28 @@ def handle_datetime(source_col: str, target_col: str) -> pl.Expr:
         A polars expression that can be used in a select statement
     """
     return pl.col(source_col).cast(pl.Datetime).dt.replace_time_zone(None, ambiguous="earliest").alias(target_col)
+
+
+def handle_flag(source_col: str, target_col: str, true_values: tuple[str, ...] = ("s", "y")) -> pl.Expr:
+    """
+    Convert a yes/no flag column to a boolean.
+
+    Values equal to one of ``true_values`` (in either case, after stripping whitespace) become True; every other
+    value, nulls included, becomes False.
+
+    Parameters
+    ----------
+    source_col : str
+        The name of the source column containing the flag
+    target_col : str
+        The name to give to the resulting column
+    true_values : tuple[str, ...], optional
+        The flag values meaning True, by default ("s", "y")
+
+    Returns
+    -------
+    pl.Expr
+        A polars expression that can be used in a select statement
+    """
+    cased_values = [case for value in true_values for case in (value.lower(), value.upper())]
+    return pl.col(source_col).str.strip_chars().is_in(cased_values).fill_null(False).alias(target_col)